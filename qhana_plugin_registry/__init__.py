@@ -14,10 +14,12 @@
 
 """Root module containing the flask app factory."""
 
+from copy import deepcopy
+from functools import lru_cache
 from json import load as load_json
 from logging import WARNING, Formatter, Handler, Logger, getLogger
 from logging.config import dictConfig
-from os import environ, makedirs
+from os import environ, makedirs, scandir
 from pathlib import Path
 from typing import Any, Dict, Optional, cast
 
@@ -26,11 +28,16 @@ from flask.app import Flask
 from flask.cli import FlaskGroup
 from flask.logging import default_handler
 from flask_cors import CORS
-from tomli import load as load_toml
+
+try:
+    from tomllib import load as load_toml  # python 3.11+
+except ImportError:
+    from tomli import load as load_toml
 
 from . import api, babel, celery, db, licenses
 from .util.config import DebugConfig, ProductionConfig
 from .util.config.from_env import load_config_from_env
+from .util.json_provider import register_json_provider
 from .util.reverse_proxy_fix import apply_reverse_proxy_fix
 from .util.ui_templates import load_ui_templates
 
@@ -39,6 +46,52 @@ from .util.ui_templates import load_ui_templates
 APP_NAME = __name__
 CONFIG_ENV_VAR_PREFIX = APP_NAME.upper().replace("-", "_").replace(" ", "_")
 
+# the options in the JSON config that are passed on to the json provider
+JSON_PROVIDER_OPTIONS = ("sort_keys", "compact")
+
+
+def _scan_instance_files(app: Flask) -> Dict[str, int]:
+    """Collect the names and modification times of all files in the instance folder.
+
+    Entries that cannot be read are skipped (with a warning).
+    """
+    instance_files: Dict[str, int] = {}
+    try:
+        entries = scandir(app.instance_path)
+    except FileNotFoundError:
+        return instance_files  # the instance folder is created later
+    except OSError as err:
+        app.logger.warning(f"Could not scan the instance folder for config files: {err}")
+        return instance_files
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_file():
+                    instance_files[entry.name] = entry.stat().st_mtime_ns
+            except OSError as err:
+                app.logger.warning(
+                    f"Skipping unreadable instance file {entry.name}: {err}"
+                )
+    return instance_files
+
+
+@lru_cache(maxsize=16)
+def _parse_config_file(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a json or toml config file (cached by path and modification time)."""
+    if path.endswith(".toml"):
+        with open(path, mode="rb") as config_file:
+            return load_toml(config_file)
+    with open(path) as config_file:
+        return load_json(config_file)
+
+
+@lru_cache(maxsize=8)
+def _get_log_formatter(
+    log_format: str, log_format_style: str, date_format: Optional[str]
+) -> Formatter:
+    """Get a (shared) formatter for the default log handler."""
+    return Formatter(log_format, style=log_format_style, datefmt=date_format)
+
 
 def create_app(test_config: Optional[Dict[str, Any]] = None):
     """Flask app factory."""
@@ -69,12 +122,18 @@ def create_app(test_config: Optional[Dict[str, Any]] = None):
         config.from_object(ProductionConfig)
 
     if test_config is None:
+        # only try to load config files that actually exist in the instance folder
+        instance_files = _scan_instance_files(app)
         # load the instance config, if it exists, when not testing
-        config.from_pyfile("config.py", silent=True)
-        # also try to load json config
-        config.from_file("config.json", load=load_json, silent=True)
-        # also try to load toml config
-        config.from_file("config.toml", load=load_toml, silent=True)
+        if "config.py" in instance_files:
+            config.from_pyfile("config.py", silent=True)
+        # also try to load json and toml config
+        for config_file in ("config.json", "config.toml"):
+            if config_file in instance_files:
+                config_path = str(Path(app.instance_path) / config_file)
+                parsed = _parse_config_file(config_path, instance_files[config_file])
+                # copy cached values as the config may be mutated later on
+                config.from_mapping(deepcopy(parsed))
         # load config from file specified in env var
         config.from_envvar(f"{CONFIG_ENV_VAR_PREFIX}_SETTINGS", silent=True)
 
@@ -95,13 +154,12 @@ def create_app(test_config: Optional[Dict[str, Any]] = None):
         # load the test config if passed in
         config.from_mapping(test_config)
 
-    # pass config to json provider
+    # use the faster orjson provider if available and pass config to json provider
+    register_json_provider(app)
     json_conf: dict = config.get("JSON", {})
-    if json_conf:
-        if "sort_keys" in json_conf:
-            app.json.sort_keys = json_conf["sort_keys"]
-        if "compact" in json_conf:
-            app.json.compact = json_conf["compact"]
+    for option in JSON_PROVIDER_OPTIONS:
+        if option in json_conf:
+            setattr(app.json, option, json_conf[option])
 
     # fix psycopg2 database urls of old docker compose files
     if (db_url := config.get("SQLALCHEMY_DATABASE_URI", "")).startswith(
@@ -126,12 +184,14 @@ def create_app(test_config: Optional[Dict[str, Any]] = None):
         log_format = cast(Optional[str], config.get("DEFAULT_LOG_FORMAT"))
         date_format = cast(Optional[str], config.get("DEFAULT_LOG_DATE_FORMAT"))
         if log_format:
-            formatter = Formatter(log_format, style=log_format_style, datefmt=date_format)
+            formatter = _get_log_formatter(log_format, log_format_style, date_format)
             default_logging_handler = cast(Handler, default_handler)
             default_logging_handler.setFormatter(formatter)
             default_logging_handler.setLevel(log_severity)
             root = getLogger()
-            root.addHandler(default_logging_handler)
+            # the default handler is a global singleton, only add it once
+            if default_logging_handler not in root.handlers:
+                root.addHandler(default_logging_handler)
             app.logger.removeHandler(default_logging_handler)
 
     logger: Logger = app.logger
@@ -144,11 +204,12 @@ def create_app(test_config: Optional[Dict[str, Any]] = None):
             'The configured SECRET_KEY="debug_secret" is unsafe and must not be used in production!'
         )
 
-    # ensure the instance folder exists
-    try:
-        makedirs(app.instance_path, exist_ok=True)
-    except OSError:
-        pass
+    # ensure the instance folder exists (a stat is cheaper than a failing mkdir)
+    if not Path(app.instance_path).is_dir():
+        try:
+            makedirs(app.instance_path, exist_ok=True)
+        except OSError:
+            pass
 
     # Begin loading extensions and routes
 
@@ -14,35 +14,39 @@
 
 """Module containing all API related code of the project."""
 
-from flask import Flask
+from importlib import import_module
 
-from .blueprint import API, ROOT_ENDPOINT
-from .models.generators.type_map import populate_metadata
-from .plugins import PLUGINS_API
-from .env import ENV_API
-from .seeds import SEEDS_API
-from .services import SERVICES_API
-from .templates import TEMPLATES_API
-from .template_tabs import TEMPLATE_TABS_API
-from .recommendations import RECOMMENDATIONS_API
+from flask import Flask
 
-from . import root  # noqa
+from .blueprint import API
 
 """A single API instance. All api versions should be blueprints."""
 
+API_BLUEPRINTS = (
+    (".root", "ROOT_ENDPOINT"),
+    (".plugins", "PLUGINS_API"),
+    (".env", "ENV_API"),
+    (".seeds", "SEEDS_API"),
+    (".services", "SERVICES_API"),
+    (".templates", "TEMPLATES_API"),
+    (".template_tabs", "TEMPLATE_TABS_API"),
+    (".recommendations", "RECOMMENDATIONS_API"),
+)
+"""All API blueprints as (module, attribute) pairs in registration order.
+
+The blueprint modules are only imported once the API is registered with an app.
+"""
+
 
 def register_root_api(app: Flask):
     """Register the API with the flask app."""
     API.init_app(app)
 
     # register API blueprints (only do this after the API is registered with flask!)
-    API.register_blueprint(ROOT_ENDPOINT)
-    API.register_blueprint(PLUGINS_API)
-    API.register_blueprint(ENV_API)
-    API.register_blueprint(SEEDS_API)
-    API.register_blueprint(SERVICES_API)
-    API.register_blueprint(TEMPLATES_API)
-    API.register_blueprint(TEMPLATE_TABS_API)
-    API.register_blueprint(RECOMMENDATIONS_API)
+    for module_name, blueprint_name in API_BLUEPRINTS:
+        module = import_module(module_name, package=__name__)
+        API.register_blueprint(getattr(module, blueprint_name))
+
+    from .models.generators.type_map import populate_metadata
 
     populate_metadata()
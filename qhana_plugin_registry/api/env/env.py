@@ -20,7 +20,7 @@ from typing import Dict, Optional
 from flask.views import MethodView
 from flask_smorest import abort
 
-from .root import ENV_API
+from .root import ENV_API, ENV_COLLECTION, ENV_DATA_SCHEMA
 from ..models.base_models import (
     ChangedApiObjectRaw,
     ChangedApiObjectSchema,
@@ -28,12 +28,13 @@ from ..models.base_models import (
     DeletedApiObjectSchema,
     get_api_response_schema,
 )
-from ..models.request_helpers import ApiResponseGenerator, CollectionResource
+from ..models.request_helpers import ApiResponseGenerator
 from ..models.env import EnvSchema
 from ...db.db import DB
 from ...db.models.env import Env
 
 
+# the string converter only matches non empty env names (minlength defaults to 1)
 @ENV_API.route("/<string:env>/")
 class EnvView(MethodView):
     """Detail endpoint of the env api."""
@@ -41,32 +42,22 @@ class EnvView(MethodView):
     @ENV_API.response(HTTPStatus.OK, get_api_response_schema(EnvSchema))
     def get(self, env: str):
         """Get a single env resource."""
-        if not env:
-            abort(HTTPStatus.BAD_REQUEST, message="The env name must not be empty!")
         found_env = Env.get(env)
         if not found_env:
             abort(HTTPStatus.NOT_FOUND, message="Env not found.")
 
         return ApiResponseGenerator.get_api_response(found_env)
 
-    @ENV_API.arguments(EnvSchema(only=("name", "value")))
+    @ENV_API.arguments(ENV_DATA_SCHEMA)
     @ENV_API.response(HTTPStatus.OK, get_api_response_schema(ChangedApiObjectSchema))
     def put(self, env_data: Dict[str, str], env: str):
         """Update a environment variable value."""
-        if not env:
-            abort(
-                HTTPStatus.BAD_REQUEST,
-                message="The env var path param must not be empty!",
-            )
         if env != env_data.get("name", env):
             abort(HTTPStatus.BAD_REQUEST, message="The env var name cannot be changed!")
-        found_env: Optional[Env] = Env.get(env)
+        found_env: Optional[Env] = Env.update_value(env, env_data["value"])
         if not found_env:
             abort(HTTPStatus.NOT_FOUND, message="Env not found.")
 
-        found_env.value = env_data["value"]
-
-        DB.session.add(found_env)
         DB.session.commit()
 
         return ApiResponseGenerator.get_api_response(
@@ -75,13 +66,12 @@ class EnvView(MethodView):
 
     @ENV_API.response(HTTPStatus.OK, get_api_response_schema(DeletedApiObjectSchema))
     def delete(self, env: str):
-        if not env:
-            abort(HTTPStatus.BAD_REQUEST, message="The env name must not be empty!")
         Env.remove(env)
         DB.session.commit()
 
-        deleted_env = Env(env, "")
+        # transient instance, only used to generate the links of the deleted env var
+        deleted_env = Env(env)
 
         return ApiResponseGenerator.get_api_response(
-            DeletedApiObjectRaw(deleted=deleted_env, redirect_to=CollectionResource(Env))
+            DeletedApiObjectRaw(deleted=deleted_env, redirect_to=ENV_COLLECTION)
         )
@@ -15,12 +15,14 @@
 """Module containing the root endpoint of the env API."""
 
 from http import HTTPStatus
-from typing import Sequence, Optional
+from typing import List, Optional, Sequence
 
 from flask.views import MethodView
 from flask_smorest import Blueprint
 
 from ..models.base_models import (
+    ApiLink,
+    ApiResponse,
     CollectionResourceSchema,
     ChangedApiObjectRaw,
     ChangedApiObjectSchema,
@@ -43,6 +45,17 @@ ENV_API = Blueprint(
     url_prefix="/api/env",
 )
 
+ENV_COLLECTION = CollectionResource(Env)
+"""Shared (read only) collection resource of all env vars used as link target."""
+
+ENV_DATA_SCHEMA = EnvSchema(only=("name", "value"))
+"""Shared schema instance for loading the env var data of POST and PUT requests."""
+
+# pre-bound generator functions for the per item loop in the collection view
+_get_api_response = ApiResponseGenerator.get_api_response
+_get_link_of = LinkGenerator.get_link_of
+_EmbeddedResource = EmbeddedResource
+
 
 @ENV_API.route("/")
 class EnvRootView(MethodView):
@@ -53,31 +66,31 @@ class EnvRootView(MethodView):
     def get(self, name: Optional[str] = None, **kwargs):
         """Get a list of env variables."""
 
-        env_vars: Sequence[Env]
-        count: Optional[int] = None
-
-        if not name:
-            env_vars = Env.get_items()
-        else:
-            env_var = Env.get(name)
-            env_vars = [env_var] if env_var else []
-            count = Env.get_count()
-
-        embedded_responses = (
-            ApiResponseGenerator.get_api_response(EmbeddedResource(item))
-            for item in env_vars
-        )
-        embedded_items = [response for response in embedded_responses if response]
-        items = [
-            link for r in embedded_items if (link := LinkGenerator.get_link_of(r.data))
-        ]
-
-        if count is None:
-            count = len(items)
+        # read only request, the session never has pending changes to flush
+        with DB.session.no_autoflush:
+            env_vars: Sequence[Env]
+
+            if not name:
+                env_vars = Env.get_items()
+            else:
+                # a name lookup matches at most one env var, no need to count the table
+                env_var = Env.get(name)
+                env_vars = [env_var] if env_var else []
+
+            # build embedded responses and item links in a single pass
+            embedded_items: List[ApiResponse] = []
+            items: List[ApiLink] = []
+            for item in env_vars:
+                response = _get_api_response(_EmbeddedResource(item))
+                if not response:
+                    continue
+                embedded_items.append(response)
+                if link := _get_link_of(response.data):
+                    items.append(link)
 
         collection_resource = CollectionResource(
             Env,
-            collection_size=count,
+            collection_size=len(items),
             item_links=items,
         )
 
@@ -87,12 +100,12 @@ class EnvRootView(MethodView):
             extra_embedded=embedded_items,
         )
 
-    @ENV_API.arguments(EnvSchema(only=("name", "value")))
+    @ENV_API.arguments(ENV_DATA_SCHEMA)
     @ENV_API.response(HTTPStatus.OK, get_api_response_schema(ChangedApiObjectSchema))
     def post(self, env_data):
         env_var = Env.set(name=env_data["name"], value=env_data["value"])
         DB.session.commit()
 
         return ApiResponseGenerator.get_api_response(
-            ChangedApiObjectRaw(self=CollectionResource(Env), changed=env_var)
+            ChangedApiObjectRaw(self=ENV_COLLECTION, changed=env_var)
         )
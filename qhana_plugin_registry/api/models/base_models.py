@@ -18,29 +18,50 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Sequence, Type, Union
 
 import marshmallow as ma
+from marshmallow.schema import SchemaMeta
 from marshmallow.validate import Length, Range
 
 from ..util import camelcase
 
 MAX_PAGE_ITEM_COUNT = 100
 
+_UNCHANGED: Any = object()  # sentinel for unchanged attributes in copy_with
 
-class MaBaseSchema(ma.Schema):
+
+class CamelCaseSchemaMeta(SchemaMeta):
+    """Schema metaclass changing the data keys of all declared fields to camelCase.
+
+    The data keys are changed once per schema class instead of once per
+    schema instance (as it would be the case in ``on_bind_field``).
+    Also precomputes the schema name returned by ``schema_name``.
+    """
+
+    def __init__(cls, name, bases, attrs):
+        super().__init__(name, bases, attrs)
+        if name.endswith(("schema", "Schema", "SCHEMA")):
+            name = name[:-6]
+        cls._schema_name = name
+        for field_name, field_obj in cls._declared_fields.items():
+            field_obj.data_key = camelcase(field_obj.data_key or field_name)
+
+
+class MaBaseSchema(ma.Schema, metaclass=CamelCaseSchemaMeta):
     """Base schema that automatically changes python snake case to camelCase in json."""
 
     # Uncomment to get ordered output
     # class Meta:
     #    ordered: bool = True
 
-    def on_bind_field(self, field_name: str, field_obj: ma.fields.Field):
-        field_obj.data_key = camelcase(field_obj.data_key or field_name)
-
     @classmethod
     def schema_name(cls) -> str:
-        name = cls.__name__
-        if name.endswith(("schema", "Schema", "SCHEMA")):
-            name = name[:-6]
-        return name
+        return cls._schema_name  # computed once in the metaclass
+
+
+_OPTIONAL_LINK_KEYS = frozenset(("doc", "schema", "name"))
+"""Keys of serialized links that are removed if they are None."""
+
+_OPTIONAL_RESPONSE_KEYS = frozenset(("keyedLinks", "key", "embedded"))
+"""Keys of serialized api responses that are removed if they are None."""
 
 
 class ApiLinkBaseSchema(MaBaseSchema):
@@ -64,11 +85,13 @@ class ApiLinkBaseSchema(MaBaseSchema):
         self, data: Dict[str, Optional[Union[str, List[str]]]], **kwargs
     ):
         """Remove empty attributes from serialized links for a smaller and more readable output."""
-        for key in ("doc", "schema", "resourceKey", "name"):
-            value = data.get(key, False)
-            if value is None or key == "resourceKey" and not value and value is not False:
+        for key in data.keys() & _OPTIONAL_LINK_KEYS:
+            if data[key] is None:
                 del data[key]
-        if not data.get("queryKey", True):  # return True if not in dict
+        # remove empty (or None) resource and query keys, get returns True if not in dict
+        if not data.get("resourceKey", True):
+            del data["resourceKey"]
+        if not data.get("queryKey", True):
             del data["queryKey"]
         return data
 
@@ -112,21 +135,80 @@ class KeyedApiLinkSchema(ApiLinkSchema):
     )
 
 
+def _dump_api_link(link: "ApiLink") -> Dict[str, Any]:
+    """Serialize an api link like the ApiLinkSchema (incl. removing empty attributes)."""
+    data: Dict[str, Any] = {
+        "href": link.href,
+        "rel": list(link.rel),
+        "resourceType": link.resource_type,
+    }
+    if link.doc is not None:
+        data["doc"] = link.doc
+    if link.schema is not None:
+        data["schema"] = link.schema
+    if link.name is not None:
+        data["name"] = link.name
+    if link.resource_key:
+        data["resourceKey"] = dict(link.resource_key)
+    return data
+
+
+def _dump_keyed_api_link(link: "KeyedApiLink") -> Dict[str, Any]:
+    """Serialize a keyed api link like the KeyedApiLinkSchema (incl. removing empty attributes)."""
+    data: Dict[str, Any] = {
+        "href": link.href,
+        "rel": list(link.rel),
+        "resourceType": link.resource_type,
+        "key": list(link.key),
+    }
+    if link.doc is not None:
+        data["doc"] = link.doc
+    if link.schema is not None:
+        data["schema"] = link.schema
+    if link.name is not None:
+        data["name"] = link.name
+    if link.query_key:
+        data["queryKey"] = list(link.query_key)
+    return data
+
+
+class ApiLinkNested(ma.fields.Nested):
+    """Nested field for (keyed) api links that serializes links without the schema.
+
+    Links are the most serialized objects in every response. The nested schema
+    is still used for the api spec and as fallback for other objects.
+    """
+
+    def _serialize(self, nested_obj, attr, obj, **kwargs):
+        if nested_obj is None:
+            return None
+        dumper = _LINK_DUMPERS.get(type(self.schema))
+        if dumper is None or self.only or self.exclude:
+            return super()._serialize(nested_obj, attr, obj, **kwargs)
+        link_type, dump_link = dumper
+        if self.many:
+            if all(type(link) is link_type for link in nested_obj):
+                return [dump_link(link) for link in nested_obj]
+        elif type(nested_obj) is link_type:
+            return dump_link(nested_obj)
+        return super()._serialize(nested_obj, attr, obj, **kwargs)
+
+
 class ApiObjectSchema(MaBaseSchema):
-    self = ma.fields.Nested(ApiLinkSchema, allow_none=False, dump_only=True)
+    self = ApiLinkNested(ApiLinkSchema, allow_none=False, dump_only=True)
 
 
 class NewApiObjectSchema(ApiObjectSchema):
-    new = ma.fields.Nested(ApiLinkSchema, allow_none=False, dump_only=True)
+    new = ApiLinkNested(ApiLinkSchema, allow_none=False, dump_only=True)
 
 
 class ChangedApiObjectSchema(ApiObjectSchema):
-    changed = ma.fields.Nested(ApiLinkSchema, allow_none=False, dump_only=True)
+    changed = ApiLinkNested(ApiLinkSchema, allow_none=False, dump_only=True)
 
 
 class DeletedApiObjectSchema(ApiObjectSchema):
-    deleted = ma.fields.Nested(ApiLinkSchema, allow_none=False, dump_only=True)
-    redirect_to = ma.fields.Nested(ApiLinkSchema, allow_none=False, dump_only=True)
+    deleted = ApiLinkNested(ApiLinkSchema, allow_none=False, dump_only=True)
+    redirect_to = ApiLinkNested(ApiLinkSchema, allow_none=False, dump_only=True)
 
 
 def _load_dynamic_api_response():
@@ -137,10 +219,10 @@ def _load_dynamic_api_response():
 
 
 class ApiResponseSchema(MaBaseSchema):
-    links = ma.fields.Nested(
+    links = ApiLinkNested(
         ApiLinkSchema, many=True, reqired=True, allow_none=False, dump_only=True
     )
-    keyed_links = ma.fields.Nested(
+    keyed_links = ApiLinkNested(
         KeyedApiLinkSchema, many=True, reqired=False, allow_none=True, dump_only=True
     )
     embedded = ma.fields.List(
@@ -156,13 +238,13 @@ class ApiResponseSchema(MaBaseSchema):
         self, data: Dict[str, Optional[Union[str, List[str]]]], **kwargs
     ):
         """Remove empty attributes from serialized api response for a smaller and more readable output."""
-        for key in ("keyedLinks", "key", "embedded"):
-            if data.get(key, False) is None:
+        for key in data.keys() & _OPTIONAL_RESPONSE_KEYS:
+            if data[key] is None:
                 del data[key]
         return data
 
 
-_api_response_schema_cache = {}
+_api_response_schema_cache: Dict[str, Type[ApiResponseSchema]] = {}
 
 
 def get_api_response_schema(
@@ -173,20 +255,22 @@ def get_api_response_schema(
     ), "Only allow ApiObjects with a self link inside an ApiResponse!"
     if name is None:
         name = schema.schema_name()
-    key = f"{name}ApiResponseSchema"
-    if key not in _api_response_schema_cache:
-        _api_response_schema_cache[key] = type(
-            key,
+    response_schema = _api_response_schema_cache.get(name)
+    if response_schema is None:
+        created = type(
+            f"{name}ApiResponseSchema",
             (ApiResponseSchema,),
             {"data": ma.fields.Nested(schema, reqired=True, allow_none=False)},
         )
-    return _api_response_schema_cache[key]
+        # setdefault is atomic, concurrent callers always get the same schema class
+        response_schema = _api_response_schema_cache.setdefault(name, created)
+    return response_schema
 
 
 class CollectionResourceSchema(ApiObjectSchema):
     collection_size = ma.fields.Integer(required=True, allow_none=False, dump_only=True)
     items = ma.fields.List(
-        ma.fields.Nested(ApiLinkSchema),
+        ApiLinkNested(ApiLinkSchema),
         dump_default=tuple(),
         required=True,
         dump_only=True,
@@ -197,7 +281,7 @@ class CursorPageSchema(ApiObjectSchema):
     collection_size = ma.fields.Integer(required=True, allow_none=False, dump_only=True)
     page = ma.fields.Integer(required=True, allow_none=False, dump_only=True)
     items = ma.fields.List(
-        ma.fields.Nested(ApiLinkSchema),
+        ApiLinkNested(ApiLinkSchema),
         dump_default=tuple(),
         required=True,
         dump_only=True,
@@ -262,22 +346,40 @@ class ApiLink(ApiLinkBase):
         name: Optional[str] = None,
         resource_key: Optional[Dict[str, str]] = None,
     ) -> None:
-        super().__init__(
-            href=href,
-            rel=rel,
-            resource_type=resource_type,
-            doc=doc,
-            schema=schema,
-            name=name,
-        )
+        # set all attributes directly, avoids the super call (links are created a lot)
+        self.href = href
+        self.rel = rel
+        self.resource_type = resource_type
+        self.doc = doc
+        self.schema = schema
+        self.name = name
         self.resource_key = resource_key
 
-    def copy_with(self, **kwargs):
-        new_kwargs = {
-            k: (kwargs[k] if k in kwargs else getattr(self, k))
-            for k in self.__dataclass_fields__.keys()
-        }
-        return ApiLink(**new_kwargs)
+    def copy_with(
+        self,
+        *,
+        href: str = _UNCHANGED,
+        rel: Sequence[str] = _UNCHANGED,
+        resource_type: str = _UNCHANGED,
+        doc: Optional[str] = _UNCHANGED,
+        schema: Optional[str] = _UNCHANGED,
+        name: Optional[str] = _UNCHANGED,
+        resource_key: Optional[Dict[str, str]] = _UNCHANGED,
+    ) -> "ApiLink":
+        """Copy the link, replacing only the passed attributes."""
+        return ApiLink(
+            href=self.href if href is _UNCHANGED else href,
+            rel=self.rel if rel is _UNCHANGED else rel,
+            resource_type=(
+                self.resource_type if resource_type is _UNCHANGED else resource_type
+            ),
+            doc=self.doc if doc is _UNCHANGED else doc,
+            schema=self.schema if schema is _UNCHANGED else schema,
+            name=self.name if name is _UNCHANGED else name,
+            resource_key=(
+                self.resource_key if resource_key is _UNCHANGED else resource_key
+            ),
+        )
 
 
 @dataclass(init=False)
@@ -299,19 +401,18 @@ class KeyedApiLink(ApiLinkBase):
         key: Sequence[str] = tuple(),
         query_key: Sequence[str] = tuple(),
     ) -> None:
-        super().__init__(
-            href=href,
-            rel=rel,
-            resource_type=resource_type,
-            doc=doc,
-            schema=schema,
-            name=name,
-        )
+        # set all attributes directly, avoids the super call (links are created a lot)
+        self.href = href
+        self.rel = rel
+        self.resource_type = resource_type
+        self.doc = doc
+        self.schema = schema
+        self.name = name
         self.key = key
         self.query_key = query_key
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseApiObject:
     self: ApiLink
 
@@ -322,7 +423,7 @@ class NewApiObjectRaw:
     new: Any
 
 
-@dataclass
+@dataclass(slots=True)
 class NewApiObject(BaseApiObject):
     new: ApiLink
 
@@ -333,7 +434,7 @@ class ChangedApiObjectRaw:
     self: Union[Any, ApiLink, None] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ChangedApiObject(BaseApiObject):
     changed: ApiLink
 
@@ -344,13 +445,13 @@ class DeletedApiObjectRaw:
     redirect_to: Union[ApiLink, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class DeletedApiObject(BaseApiObject):
     deleted: ApiLink
     redirect_to: Optional[ApiLink]
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiResponse:
     links: Sequence[ApiLink]
     data: Any
@@ -358,14 +459,21 @@ class ApiResponse:
     keyed_links: Optional[Sequence[KeyedApiLink]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CollectionResource(BaseApiObject):
     collection_size: int
     items: Sequence[ApiLink]
 
 
-@dataclass
+@dataclass(slots=True)
 class CursorPage(BaseApiObject):
     collection_size: int
     page: int
     items: Sequence[ApiLink]
+
+
+_LINK_DUMPERS = {
+    ApiLinkSchema: (ApiLink, _dump_api_link),
+    KeyedApiLinkSchema: (KeyedApiLink, _dump_keyed_api_link),
+}
+"""Fast serializers of the link schemas used by ApiLinkNested (schema -> link type, serializer)."""
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any
+from typing import Any, Dict, Type
 
 import marshmallow as ma
 from marshmallow.base import SchemaABC
@@ -22,16 +22,22 @@ from . import base_models as bm
 from . import request_helpers as rh
 from .generators import type_map as tm
 
+_SCHEMA_INSTANCE_CACHE: Dict[Type, ma.Schema] = {}
+"""Cache of schema instances used to dump the data of a resource type."""
+
 
 class DynamicApiResponseSchema(bm.ApiResponseSchema):
     data = ma.fields.Method("dump_data", reqired=True, allow_none=False, dump_only=True)
 
     def dump_data(self, obj: Any) -> Any:
         attr: Any = super().get_attribute(obj, "data", None)
-        many: bool = is_collection(attr)
-        assert not many, "Collections are not supported!"
         attr_type = type(attr)
-        schema = tm.TYPE_TO_METADATA[attr_type].schema
-        if issubclass(schema, SchemaABC):
-            schema = schema()
+        schema = _SCHEMA_INSTANCE_CACHE.get(attr_type)
+        if schema is None:
+            # only checked once per type, collections never get a cached schema
+            assert not is_collection(attr), "Collections are not supported!"
+            schema = tm.TYPE_TO_METADATA[attr_type].schema
+            if issubclass(schema, SchemaABC):
+                schema = schema()
+            _SCHEMA_INSTANCE_CACHE[attr_type] = schema
         return schema.dump(rh.ApiObjectGenerator.get_api_object(attr))
@@ -68,8 +68,6 @@ TEMPLATE_TAB_ID_KEY = "uiTemplateTabId"
 
 SEED_ID_KEY = "seedId"
 
-PLUGIN_ID_KEY = "pluginId"
-
 
 # query keys
 ITEM_COUNT_QUERY_KEY = "item-count"
@@ -110,9 +108,9 @@ ROOT_EXTRA_LINK_RELATIONS = (
     TEMPLATE_REL_TYPE,
 )
 
-ENV_EXTRA_LINK_RELATIONS = tuple()
+ENV_EXTRA_LINK_RELATIONS = ()
 
-SERVICE_EXTRA_LINK_RELATIONS = tuple()
+SERVICE_EXTRA_LINK_RELATIONS = ()
 
 TEMPLATE_EXTRA_LINK_RELATIONS = (
     TEMPLATE_TAB_REL_TYPE,
@@ -121,9 +119,9 @@ TEMPLATE_EXTRA_LINK_RELATIONS = (
 
 TEMPLATE_TAB_EXTRA_LINK_RELATIONS = (PLUGIN_REL_TYPE,)
 
-SEED_EXTRA_LINK_RELATIONS = tuple()
+SEED_EXTRA_LINK_RELATIONS = ()
 
-PLUGIN_EXTRA_LINK_RELATIONS = tuple()
+PLUGIN_EXTRA_LINK_RELATIONS = ()
 
 
 # endpoints ####################################################################
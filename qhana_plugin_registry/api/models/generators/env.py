@@ -19,7 +19,6 @@ from typing import Dict, Iterable, Optional
 from flask import url_for
 
 from .constants import (
-    API_SPEC_RESOURCE,
     COLLECTION_REL,
     CREATE_REL,
     DELETE_REL,
@@ -39,10 +38,14 @@ from ..request_helpers import (
     KeyGenerator,
     LinkGenerator,
     CollectionResource,
+    get_schema_url,
 )
 from ..env import EnvData
 from ....db.models.env import Env
 
+_ENV_COLLECTION = CollectionResource(Env)
+"""Shared (read only) collection resource, the parent of all env vars."""
+
 # Env Collection ###############################################################
 
 
@@ -73,7 +76,7 @@ class EnvCollectionLinkGenerator(LinkGenerator, resource_type=Env, page=True):
             rel=(COLLECTION_REL,),
             resource_type=meta.rel_type,
             resource_key=KeyGenerator.generate_key(resource, query_params=query_params),
-            schema=f"{url_for(API_SPEC_RESOURCE, _external=True)}#/components/schemas/{CursorPageSchema.schema_name()}",
+            schema=get_schema_url(CursorPageSchema.schema_name()),
         )
 
 
@@ -114,7 +117,7 @@ class EnvCollectionCreateEnvLinkGenerator(
 class EnvKeyGenerator(KeyGenerator, resource_type=Env):
     def update_key(self, key: Dict[str, str], resource: Env) -> Dict[str, str]:
         assert isinstance(resource, Env)
-        parent_key = KeyGenerator.generate_key(CollectionResource(Env))
+        parent_key = KeyGenerator.generate_key(_ENV_COLLECTION)
         key.update(parent_key)
         key[ENV_ID_KEY] = str(resource.name)
         return key
@@ -128,10 +131,10 @@ class EnvSelfLinkGenerator(LinkGenerator, resource_type=Env):
 
         return ApiLink(
             href=url_for(meta.endpoint, env=str(resource.name), _external=True),
-            rel=tuple(),
+            rel=(),
             resource_type=meta.rel_type,
             resource_key=KeyGenerator.generate_key(resource),
-            schema=f"{url_for(API_SPEC_RESOURCE, _external=True)}#/components/schemas/{meta.schema_id}",
+            schema=get_schema_url(meta.schema_id),
             name=resource.name,
         )
 
@@ -140,9 +143,7 @@ class EnvUpLinkGenerator(LinkGenerator, resource_type=Env, relation=UP_REL):
     def generate_link(
         self, resource: Env, *, query_params: Optional[Dict[str, str]] = None
     ) -> Optional[ApiLink]:
-        return LinkGenerator.get_link_of(
-            CollectionResource(Env), extra_relations=(UP_REL,)
-        )
+        return LinkGenerator.get_link_of(_ENV_COLLECTION, extra_relations=(UP_REL,))
 
 
 class UpdateEnvLinkGenerator(LinkGenerator, resource_type=Env, relation=UPDATE_REL):
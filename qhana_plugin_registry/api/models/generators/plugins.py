@@ -16,10 +16,7 @@
 
 from typing import Dict, Iterable, Optional
 
-from flask import url_for
-
 from .constants import (
-    API_SPEC_RESOURCE,
     COLLECTION_REL,
     ITEM_COUNT_DEFAULT,
     ITEM_COUNT_QUERY_KEY,
@@ -39,9 +36,14 @@ from ..request_helpers import (
     KeyGenerator,
     LinkGenerator,
     PageResource,
+    external_url_for,
+    get_schema_url,
 )
 from ....db.models.plugins import RAMP
 
+_PLUGIN_FIRST_PAGE = PageResource(RAMP, page_number=1)
+"""Shared (read only) first plugin page, the parent resource of all plugins."""
+
 # Plugin Page ##################################################################
 
 
@@ -66,11 +68,11 @@ class PluginPageLinkGenerator(LinkGenerator, resource_type=RAMP, page=True):
         assert endpoint is not None
 
         return ApiLink(
-            href=url_for(endpoint, **query_params, _external=True),
+            href=external_url_for(endpoint, **query_params),
             rel=(COLLECTION_REL, PAGE_REL),
             resource_type=meta.rel_type,
             resource_key=KeyGenerator.generate_key(resource, query_params=query_params),
-            schema=f"{url_for(API_SPEC_RESOURCE, _external=True)}#/components/schemas/{CursorPageSchema.schema_name()}",
+            schema=get_schema_url(CursorPageSchema.schema_name()),
         )
 
 
@@ -103,9 +105,14 @@ class PluginPagePostLinkGenerator(
 
 
 class PluginKeyGenerator(KeyGenerator, resource_type=RAMP):
+    _parent_key: Optional[Dict[str, str]] = None
+
     def update_key(self, key: Dict[str, str], resource: RAMP) -> Dict[str, str]:
         assert isinstance(resource, RAMP)
-        parent_key = KeyGenerator.generate_key(PageResource(RAMP, page_number=1))
+        parent_key = self._parent_key
+        if parent_key is None:
+            # the parent page is shared by all plugins, its key never changes
+            parent_key = self._parent_key = KeyGenerator.generate_key(_PLUGIN_FIRST_PAGE)
         key.update(parent_key)
         key[PLUGIN_ID_KEY] = str(resource.id)
         return key
@@ -118,11 +125,11 @@ class PluginSelfLinkGenerator(LinkGenerator, resource_type=RAMP):
         meta = TYPE_TO_METADATA[RAMP]
 
         return ApiLink(
-            href=url_for(meta.endpoint, plugin_id=str(resource.id), _external=True),
-            rel=tuple(),
+            href=external_url_for(meta.endpoint, plugin_id=str(resource.id)),
+            rel=(),
             resource_type=meta.rel_type,
             resource_key=KeyGenerator.generate_key(resource),
-            schema=f"{url_for(API_SPEC_RESOURCE, _external=True)}#/components/schemas/{meta.schema_id}",
+            schema=get_schema_url(meta.schema_id),
             name=f"{resource.name} ({resource.version})",
         )
 
@@ -131,10 +138,7 @@ class PluginUpLinkGenerator(LinkGenerator, resource_type=RAMP, relation=UP_REL):
     def generate_link(
         self, resource: RAMP, *, query_params: Optional[Dict[str, str]] = None
     ) -> Optional[ApiLink]:
-        return LinkGenerator.get_link_of(
-            PageResource(RAMP, page_number=1),
-            extra_relations=(UP_REL,),
-        )
+        return LinkGenerator.get_link_of(_PLUGIN_FIRST_PAGE, extra_relations=(UP_REL,))
 
 
 class PluginApiObjectGenerator(ApiObjectGenerator, resource_type=RAMP):
@@ -150,11 +154,8 @@ class PluginApiObjectGenerator(ApiObjectGenerator, resource_type=RAMP):
         input_data = [
             InputDataMetadata(
                 required=d.required,
-                content_type=[
-                    f"{c.content_type_start}/{c.content_type_end}"
-                    for c in d.content_types
-                ],
-                data_type=f"{d.data_type_start}/{d.data_type_end}",
+                content_type=[c.content_type for c in d.content_types],
+                data_type=d.data_type,
                 parameter=d.identifier,
             )
             for d in resource.data_consumed
@@ -163,11 +164,8 @@ class PluginApiObjectGenerator(ApiObjectGenerator, resource_type=RAMP):
         output_data = [
             DataMetadata(  # FIXME identifier/output name not used (not provided by plugins??)
                 required=d.required,
-                content_type=[
-                    f"{c.content_type_start}/{c.content_type_end}"
-                    for c in d.content_types
-                ],
-                data_type=f"{d.data_type_start}/{d.data_type_end}",
+                content_type=[c.content_type for c in d.content_types],
+                data_type=d.data_type,
             )
             for d in resource.data_produced
         ]
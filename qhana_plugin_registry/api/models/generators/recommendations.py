@@ -19,7 +19,6 @@ from typing import Dict, Iterable, Optional
 from flask import url_for
 
 from .constants import (
-    API_SPEC_RESOURCE,
     COLLECTION_REL,
     NAV_REL,
     ROOT_RESOURCE_DUMMY,
@@ -37,6 +36,7 @@ from ..request_helpers import (
     ApiResponseGenerator,
     KeyGenerator,
     LinkGenerator,
+    get_schema_url,
 )
 
 # Recommendation Collection ####################################################
@@ -76,7 +76,7 @@ class RecommendationCollectionLinkGenerator(
             rel=(COLLECTION_REL,),
             resource_type=meta.rel_type,
             resource_key=KeyGenerator.generate_key(resource, query_params=query_params),
-            schema=f"{url_for(API_SPEC_RESOURCE, _external=True)}#/components/schemas/{RecommendationCollectionSchema.schema_name()}",
+            schema=get_schema_url(RecommendationCollectionSchema.schema_name()),
         )
 
 
@@ -111,11 +111,7 @@ class RecommendationApiObjectGenerator(
 
         assert self_link is not None
 
-        items = [
-            link
-            for plugin in resource.plugins
-            if (link := LinkGenerator.get_link_of(plugin))
-        ]
+        items = list(filter(None, map(LinkGenerator.get_link_of, resource.plugins)))
 
         return RecommendationCollection(
             self=self_link,
@@ -16,11 +16,8 @@
 
 from typing import Dict, Iterable, Optional
 
-from flask import url_for
-
 from .constants import (
     API_REL,
-    API_SPEC_RESOURCE,
     ENV_REL_TYPE,
     NAV_REL,
     PLUGIN_REL_TYPE,
@@ -39,6 +36,8 @@ from ..request_helpers import (
     KeyGenerator,
     LinkGenerator,
     PageResource,
+    external_url_for,
+    get_schema_url,
 )
 from ..root import RootData
 from ..root_raw import RootDataRaw
@@ -63,12 +62,11 @@ class RootDataLinkGenerator(LinkGenerator, resource_type=RootDataRaw):
         meta = TYPE_TO_METADATA[RootDataRaw]
 
         return ApiLink(
-            href=url_for(meta.endpoint, _external=True),
-            rel=tuple(),
+            href=external_url_for(meta.endpoint),
+            rel=(),
             resource_type=meta.rel_type,
             resource_key=KeyGenerator.generate_key(resource, query_params=query_params),
-            schema=url_for(API_SPEC_RESOURCE, _external=True)
-            + f"#/components/schemas/{meta.schema_id}",
+            schema=get_schema_url(meta.schema_id),
         )
 
 
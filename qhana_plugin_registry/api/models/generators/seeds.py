@@ -16,10 +16,7 @@
 
 from typing import Dict, Iterable, Optional
 
-from flask import url_for
-
 from .constants import (
-    API_SPEC_RESOURCE,
     COLLECTION_REL,
     CREATE_REL,
     DELETE_REL,
@@ -40,10 +37,15 @@ from ..request_helpers import (
     KeyGenerator,
     LinkGenerator,
     PageResource,
+    external_url_for,
+    get_schema_url,
 )
 from ..seeds import SeedData
 from ....db.models.seeds import Seed
 
+_SEED_FIRST_PAGE = PageResource(Seed, page_number=1)
+"""Shared (read only) first seed page, the parent resource of all seeds."""
+
 # Seed Page ####################################################################
 
 
@@ -68,11 +70,11 @@ class SeedPageLinkGenerator(LinkGenerator, resource_type=Seed, page=True):
         assert endpoint is not None
 
         return ApiLink(
-            href=url_for(endpoint, **query_params, _external=True),
+            href=external_url_for(endpoint, **query_params),
             rel=(COLLECTION_REL, PAGE_REL),
             resource_type=meta.rel_type,
             resource_key=KeyGenerator.generate_key(resource, query_params=query_params),
-            schema=f"{url_for(API_SPEC_RESOURCE, _external=True)}#/components/schemas/{CursorPageSchema.schema_name()}",
+            schema=get_schema_url(CursorPageSchema.schema_name()),
         )
 
 
@@ -105,9 +107,14 @@ class SeedPageCreateSeedLinkGenerator(
 
 
 class SeedKeyGenerator(KeyGenerator, resource_type=Seed):
+    _parent_key: Optional[Dict[str, str]] = None
+
     def update_key(self, key: Dict[str, str], resource: Seed) -> Dict[str, str]:
         assert isinstance(resource, Seed)
-        parent_key = KeyGenerator.generate_key(PageResource(Seed, page_number=1))
+        parent_key = self._parent_key
+        if parent_key is None:
+            # the parent is always the first page, its key never changes
+            parent_key = self._parent_key = KeyGenerator.generate_key(_SEED_FIRST_PAGE)
         key.update(parent_key)
         key[SEED_ID_KEY] = str(resource.id)
         return key
@@ -120,11 +127,11 @@ class SeedSelfLinkGenerator(LinkGenerator, resource_type=Seed):
         meta = TYPE_TO_METADATA[Seed]
 
         return ApiLink(
-            href=url_for(meta.endpoint, seed_id=str(resource.id), _external=True),
-            rel=tuple(),
+            href=external_url_for(meta.endpoint, seed_id=str(resource.id)),
+            rel=(),
             resource_type=meta.rel_type,
             resource_key=KeyGenerator.generate_key(resource),
-            schema=f"{url_for(API_SPEC_RESOURCE, _external=True)}#/components/schemas/{meta.schema_id}",
+            schema=get_schema_url(meta.schema_id),
             name=resource.url,
         )
 
@@ -134,7 +141,7 @@ class SeedUpLinkGenerator(LinkGenerator, resource_type=Seed, relation=UP_REL):
         self, resource: Seed, *, query_params: Optional[Dict[str, str]] = None
     ) -> Optional[ApiLink]:
         return LinkGenerator.get_link_of(
-            PageResource(Seed, page_number=1),
+            _SEED_FIRST_PAGE,
             extra_relations=(UP_REL,),
         )
 
@@ -16,10 +16,7 @@
 
 from typing import Dict, Iterable, Optional
 
-from flask import url_for
-
 from .constants import (
-    API_SPEC_RESOURCE,
     COLLECTION_REL,
     CREATE_REL,
     DELETE_REL,
@@ -42,10 +39,15 @@ from ..request_helpers import (
     KeyGenerator,
     LinkGenerator,
     PageResource,
+    external_url_for,
+    get_schema_url,
 )
 from ..service import ServiceData
 from ....db.models.services import Service
 
+_SERVICE_FIRST_PAGE = PageResource(Service, page_number=1)
+"""Shared (read only) first service page, the parent resource of all services."""
+
 # Service Page #################################################################
 
 
@@ -70,11 +72,11 @@ class ServicePageLinkGenerator(LinkGenerator, resource_type=Service, page=True):
         assert endpoint is not None
 
         return ApiLink(
-            href=url_for(endpoint, **query_params, _external=True),
+            href=external_url_for(endpoint, **query_params),
             rel=(COLLECTION_REL, PAGE_REL),
             resource_type=meta.rel_type,
             resource_key=KeyGenerator.generate_key(resource, query_params=query_params),
-            schema=f"{url_for(API_SPEC_RESOURCE, _external=True)}#/components/schemas/{CursorPageSchema.schema_name()}",
+            schema=get_schema_url(CursorPageSchema.schema_name()),
         )
 
 
@@ -107,9 +109,14 @@ class ServicePageCreateServiceLinkGenerator(
 
 
 class ServiceKeyGenerator(KeyGenerator, resource_type=Service):
+    _parent_key: Optional[Dict[str, str]] = None
+
     def update_key(self, key: Dict[str, str], resource: Service) -> Dict[str, str]:
         assert isinstance(resource, Service)
-        parent_key = KeyGenerator.generate_key(PageResource(Service, page_number=1))
+        parent_key = self._parent_key
+        if parent_key is None:
+            # the parent is always the first page, its key never changes
+            parent_key = self._parent_key = KeyGenerator.generate_key(_SERVICE_FIRST_PAGE)
         key.update(parent_key)
         key[SERVICE_ID_KEY] = str(resource.service_id)
         return key
@@ -122,13 +129,11 @@ class ServiceSelfLinkGenerator(LinkGenerator, resource_type=Service):
         meta = TYPE_TO_METADATA[Service]
 
         return ApiLink(
-            href=url_for(
-                meta.endpoint, service_id=str(resource.service_id), _external=True
-            ),
-            rel=tuple(),
+            href=external_url_for(meta.endpoint, service_id=str(resource.service_id)),
+            rel=(),
             resource_type=meta.rel_type,
             resource_key=KeyGenerator.generate_key(resource),
-            schema=f"{url_for(API_SPEC_RESOURCE, _external=True)}#/components/schemas/{meta.schema_id}",
+            schema=get_schema_url(meta.schema_id),
             name=resource.name,
         )
 
@@ -138,7 +143,7 @@ class ServiceUpLinkGenerator(LinkGenerator, resource_type=Service, relation=UP_R
         self, resource: Service, *, query_params: Optional[Dict[str, str]] = None
     ) -> Optional[ApiLink]:
         return LinkGenerator.get_link_of(
-            PageResource(Service, page_number=1),
+            _SERVICE_FIRST_PAGE,
             extra_relations=(UP_REL,),
         )
 
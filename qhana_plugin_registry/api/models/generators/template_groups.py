@@ -16,10 +16,7 @@
 
 from typing import Dict, Iterable, Optional
 
-from flask import url_for
-
 from .constants import (
-    API_SPEC_RESOURCE,
     COLLECTION_REL,
     UP_REL,
     TEMPLATE_GROUP_QUERY_KEY,
@@ -33,6 +30,8 @@ from ..request_helpers import (
     ApiResponseGenerator,
     KeyGenerator,
     LinkGenerator,
+    external_url_for,
+    get_schema_url,
 )
 
 # Template Group Collection ####################################################
@@ -65,7 +64,8 @@ class TemplateGroupLinkGenerator(LinkGenerator, resource_type=TemplateGroupRaw):
         if query_params is None:
             query_params = {TEMPLATE_GROUP_QUERY_KEY: resource.location}
         else:
-            query_params[TEMPLATE_GROUP_QUERY_KEY] = resource.location
+            # copy to not change the query params of the caller
+            query_params = {**query_params, TEMPLATE_GROUP_QUERY_KEY: resource.location}
 
         if resource.name:
             name = resource.name
@@ -73,16 +73,13 @@ class TemplateGroupLinkGenerator(LinkGenerator, resource_type=TemplateGroupRaw):
             name = f"Tab Group: {resource.location}"
 
         return ApiLink(
-            href=url_for(
-                endpoint,
-                template_id=str(resource.template.id),
-                **query_params,
-                _external=True,
+            href=external_url_for(
+                endpoint, template_id=str(resource.template.id), **query_params
             ),
             rel=(COLLECTION_REL,),
             resource_type=meta.rel_type,
             resource_key=KeyGenerator.generate_key(resource, query_params=query_params),
-            schema=f"{url_for(API_SPEC_RESOURCE, _external=True)}#/components/schemas/{TemplateGroupSchema.schema_name()}",
+            schema=get_schema_url(TemplateGroupSchema.schema_name()),
             name=name,
         )
 
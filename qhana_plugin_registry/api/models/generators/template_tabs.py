@@ -16,10 +16,7 @@
 
 from typing import Dict, Iterable, Optional
 
-from flask import url_for
-
 from .constants import (
-    API_SPEC_RESOURCE,
     COLLECTION_REL,
     CREATE_REL,
     UPDATE_REL,
@@ -43,12 +40,17 @@ from ..request_helpers import (
     LinkGenerator,
     CollectionResource,
     PageResource,
+    external_url_for,
+    get_schema_url,
 )
 from ..templates import TemplateTabData
 from ..templates_raw import TemplateGroupRaw
 from ....db.models.templates import TemplateTab, UiTemplate
 from ....db.models.plugins import RAMP
 
+_PLUGIN_PAGE = PageResource(RAMP)
+"""Shared (read only) plugin page resource used for the plugin links of the tabs."""
+
 # Template Page ################################################################
 
 
@@ -79,16 +81,13 @@ class TemplateTabPageLinkGenerator(LinkGenerator, resource_type=TemplateTab, pag
         assert endpoint is not None
 
         return ApiLink(
-            href=url_for(
-                endpoint,
-                template_id=str(resource.resource.id),
-                **query_params,
-                _external=True,
+            href=external_url_for(
+                endpoint, template_id=str(resource.resource.id), **query_params
             ),
             rel=(COLLECTION_REL,),
             resource_type=meta.rel_type,
             resource_key=KeyGenerator.generate_key(resource, query_params=query_params),
-            schema=f"{url_for(API_SPEC_RESOURCE, _external=True)}#/components/schemas/{CursorPageSchema.schema_name()}",
+            schema=get_schema_url(CursorPageSchema.schema_name()),
         )
 
 
@@ -131,7 +130,7 @@ class TemplateTabKeyGenerator(KeyGenerator, resource_type=TemplateTab):
         assert isinstance(resource, TemplateTab)
         template = resource.template
         assert template is not None
-        parent_resource = TemplateGroupRaw(template, resource.location, None, [])
+        parent_resource = TemplateGroupRaw(template, resource.location, None, ())
         parent_key = KeyGenerator.generate_key(parent_resource)
         key.update(parent_key)
         key[TEMPLATE_TAB_ID_KEY] = str(resource.id)
@@ -148,16 +147,15 @@ class TemplateTabSelfLinkGenerator(LinkGenerator, resource_type=TemplateTab):
         meta = TYPE_TO_METADATA[TemplateTab]
 
         return ApiLink(
-            href=url_for(
+            href=external_url_for(
                 meta.endpoint,
                 template_id=str(resource.template_id),
                 tab_id=str(resource.id),
-                _external=True,
             ),
-            rel=tuple(),
+            rel=(),
             resource_type=meta.rel_type,
             resource_key=KeyGenerator.generate_key(resource),
-            schema=f"{url_for(API_SPEC_RESOURCE, _external=True)}#/components/schemas/{meta.schema_id}",
+            schema=get_schema_url(meta.schema_id),
             name=resource.name,
         )
 
@@ -173,7 +171,7 @@ class TemplateTabUpLinkGenerator(
     ) -> Optional[ApiLink]:
         template = resource.template
         assert template is not None
-        parent_resource = TemplateGroupRaw(template, resource.location, None, [])
+        parent_resource = TemplateGroupRaw(template, resource.location, None, ())
         return LinkGenerator.get_link_of(
             parent_resource,
             extra_relations=(UP_REL,),
@@ -222,7 +220,7 @@ class TemplateTabToPluginsNavLinkGenerator(
         query_params: Optional[Dict[str, str]] = None,
     ) -> Optional[ApiLink]:
         return LinkGenerator.get_link_of(
-            PageResource(RAMP),
+            _PLUGIN_PAGE,
             query_params={"template-tab": str(resource.id)},
             extra_relations=(NAV_REL,),
         )
@@ -242,7 +240,7 @@ class TemplateTabApiObjectGenerator(ApiObjectGenerator, resource_type=TemplateTa
         assert self_link is not None
 
         plugin_link = LinkGenerator.get_link_of(
-            PageResource(RAMP), query_params={"template-tab": str(resource.id)}
+            _PLUGIN_PAGE, query_params={"template-tab": str(resource.id)}
         )
 
         assert plugin_link is not None
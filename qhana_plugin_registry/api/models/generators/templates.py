@@ -14,12 +14,9 @@
 
 """Generators for all Template resources."""
 
-from typing import Dict, Iterable, Optional, Set
-
-from flask import url_for
+from typing import Dict, Iterable, List, Optional, Set
 
 from .constants import (
-    API_SPEC_RESOURCE,
     COLLECTION_REL,
     CREATE_REL,
     UPDATE_REL,
@@ -43,11 +40,16 @@ from ..request_helpers import (
     KeyGenerator,
     LinkGenerator,
     PageResource,
+    external_url_for,
+    get_schema_url,
 )
 from ..templates import TemplateData
 from ..templates_raw import TemplateGroupRaw
 from ....db.models.templates import TemplateTab, UiTemplate
 
+_TEMPLATE_FIRST_PAGE = PageResource(UiTemplate, page_number=1)
+"""Shared (read only) first template page, the parent resource of all templates."""
+
 # Template Page ################################################################
 
 
@@ -72,11 +74,11 @@ class TemplatePageLinkGenerator(LinkGenerator, resource_type=UiTemplate, page=Tr
         assert endpoint is not None
 
         return ApiLink(
-            href=url_for(endpoint, **query_params, _external=True),
+            href=external_url_for(endpoint, **query_params),
             rel=(COLLECTION_REL, PAGE_REL),
             resource_type=meta.rel_type,
             resource_key=KeyGenerator.generate_key(resource, query_params=query_params),
-            schema=f"{url_for(API_SPEC_RESOURCE, _external=True)}#/components/schemas/{CursorPageSchema.schema_name()}",
+            schema=get_schema_url(CursorPageSchema.schema_name()),
         )
 
 
@@ -109,9 +111,16 @@ class TemplatePageCreateTemplateLinkGenerator(
 
 
 class TemplateKeyGenerator(KeyGenerator, resource_type=UiTemplate):
+    _parent_key: Optional[Dict[str, str]] = None
+
     def update_key(self, key: Dict[str, str], resource: UiTemplate) -> Dict[str, str]:
         assert isinstance(resource, UiTemplate)
-        parent_key = KeyGenerator.generate_key(PageResource(UiTemplate, page_number=1))
+        parent_key = self._parent_key
+        if parent_key is None:
+            # the parent is always the first page, its key never changes
+            parent_key = self._parent_key = KeyGenerator.generate_key(
+                _TEMPLATE_FIRST_PAGE
+            )
         key.update(parent_key)
         key[TEMPLATE_ID_KEY] = str(resource.id)
         return key
@@ -127,11 +136,11 @@ class TemplateSelfLinkGenerator(LinkGenerator, resource_type=UiTemplate):
         meta = TYPE_TO_METADATA[UiTemplate]
 
         return ApiLink(
-            href=url_for(meta.endpoint, template_id=str(resource.id), _external=True),
-            rel=tuple(),
+            href=external_url_for(meta.endpoint, template_id=str(resource.id)),
+            rel=(),
             resource_type=meta.rel_type,
             resource_key=KeyGenerator.generate_key(resource),
-            schema=f"{url_for(API_SPEC_RESOURCE, _external=True)}#/components/schemas/{meta.schema_id}",
+            schema=get_schema_url(meta.schema_id),
             name=resource.name,
         )
 
@@ -144,7 +153,7 @@ class TemplateUpLinkGenerator(LinkGenerator, resource_type=UiTemplate, relation=
         query_params: Optional[Dict[str, str]] = None,
     ) -> Optional[ApiLink]:
         return LinkGenerator.get_link_of(
-            PageResource(UiTemplate, page_number=1),
+            _TEMPLATE_FIRST_PAGE,
             extra_relations=(UP_REL,),
         )
 
@@ -237,16 +246,11 @@ class TemplateApiObjectGenerator(ApiObjectGenerator, resource_type=UiTemplate):
                 if group in group_locations:
                     group_locations[group] = t.name
 
-        groups = (
-            TemplateGroupRaw(
-                template=resource,
-                location=loc,
-                name=name,
-                items=[],
-            )
-            for loc, name in group_locations.items()
-        )
-        group_links = [l for g in groups if (l := LinkGenerator.get_link_of(g))]
+        group_links: List[ApiLink] = []
+        for loc, name in group_locations.items():
+            group = TemplateGroupRaw(template=resource, location=loc, name=name, items=())
+            if link := LinkGenerator.get_link_of(group):
+                group_links.append(link)
 
         return TemplateData(
             self=self_link,
@@ -15,15 +15,15 @@
 """Map(s) containing relations of types to api constants"""
 
 from dataclasses import dataclass
-from typing import Optional, Sequence, Type
+from typing import Optional, Tuple, Type
 
 from marshmallow.base import SchemaABC
 
 
-@dataclass()
+@dataclass(frozen=True, slots=True)
 class ResourceMetadata:
     rel_type: str
-    extra_link_rels: Sequence[str]
+    extra_link_rels: Tuple[str, ...]
     endpoint: str
     schema: Type[SchemaABC]
     schema_id: str
@@ -36,7 +36,12 @@ TYPE_TO_METADATA = {}
 def populate_metadata():
     """
     To prevent circular imports, the endpoints will be populated here and the necessary imports will be done here.
+
+    The metadata only depends on module level objects, so it is populated at most once per process.
     """
+    if TYPE_TO_METADATA:
+        return
+
     from . import constants as c
     from ..env import EnvSchema
     from ..plugins import PluginSchema
@@ -47,16 +52,14 @@ def populate_metadata():
     from ..seeds import SeedSchema
     from ..service import ServiceSchema
     from ..templates import TemplateSchema, TemplateGroupSchema, TemplateTabSchema
-    from ... import (
-        ENV_API,
-        PLUGINS_API,
-        RECOMMENDATIONS_API,
-        ROOT_ENDPOINT,
-        SEEDS_API,
-        SERVICES_API,
-        TEMPLATES_API,
-        TEMPLATE_TABS_API,
-    )
+    from ...blueprint import ROOT_ENDPOINT
+    from ...env import ENV_API
+    from ...plugins import PLUGINS_API
+    from ...recommendations import RECOMMENDATIONS_API
+    from ...seeds import SEEDS_API
+    from ...services import SERVICES_API
+    from ...templates import TEMPLATES_API
+    from ...template_tabs import TEMPLATE_TABS_API
     from ...env.env import EnvView
     from ...env.root import EnvRootView
     from ...plugins.plugin import PluginView
@@ -143,7 +146,7 @@ def populate_metadata():
     )
     TYPE_TO_METADATA[RecommendationDataRaw] = ResourceMetadata(
         rel_type=c.RECOMMENDATION_REL_TYPE,
-        extra_link_rels=tuple(),
+        extra_link_rels=(),
         endpoint="",
         schema=RecommendationCollectionSchema,
         schema_id=RecommendationCollectionSchema.schema_name(),
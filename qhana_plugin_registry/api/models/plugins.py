@@ -279,14 +279,14 @@ class PluginSchema(ApiObjectSchema):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class DataMetadata:
     data_type: str
     content_type: List[str]
     required: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class InputDataMetadata(DataMetadata):
     parameter: str
 
@@ -301,7 +301,7 @@ class PluginDependencyMetadata:
     required: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class EntryPoint:
     href: str
     ui_href: str
@@ -310,7 +310,7 @@ class EntryPoint:
     plugin_dependencies: List[PluginDependencyMetadata] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginData(BaseApiObject):
     href: str
     title: str
@@ -56,6 +56,6 @@ class RecommendationCollectionSchema(CollectionResourceSchema):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class RecommendationCollection(CollectionResource):
     weights: Sequence[float]
@@ -15,9 +15,22 @@
 """Utilities for creating resource keys, links, data and full api responses."""
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from itertools import chain
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
+from flask import current_app, has_request_context, request, url_for
 from sqlalchemy.exc import ArgumentError
 
 from .base_models import ApiLink, ApiResponse, BaseApiObject
@@ -92,6 +105,70 @@ def query_params_to_api_key(query_params: Dict[str, str]) -> Dict[str, str]:
     return key
 
 
+_SCHEMA_URL_CACHE = "qhana_plugin_registry_schema_url_cache"
+_EXTERNAL_URL_CACHE = "qhana_plugin_registry_external_url_cache"
+
+
+def _get_app_cache(
+    name: str, func: Callable[..., str], maxsize: int
+) -> Callable[..., str]:
+    """Get the lru cache of ``func`` stored in the extensions of the current app.
+
+    Each app has its own url map (and config), so caches must not be shared
+    between apps in the same process.
+    """
+    cache = current_app.extensions.get(name)
+    if cache is None:
+        cache = current_app.extensions[name] = lru_cache(maxsize=maxsize)(func)
+    return cache
+
+
+def _build_schema_url(schema_name: str) -> str:
+    spec_url = url_for(API_SPEC_RESOURCE, _external=True)
+    return f"{spec_url}#/components/schemas/{schema_name}"
+
+
+def _build_schema_url_for_root(url_root: str, schema_name: str) -> str:
+    return _build_schema_url(schema_name)
+
+
+def get_schema_url(schema_name: str) -> str:
+    """Get the external url of a schema in the api spec.
+
+    The full schema urls are cached per app by url root (inside of requests).
+    """
+    if has_request_context():
+        cache = _get_app_cache(_SCHEMA_URL_CACHE, _build_schema_url_for_root, 256)
+        return cache(request.url_root, schema_name)
+    return _build_schema_url(schema_name)
+
+
+def _build_external_url(
+    url_root: str, endpoint: str, values: Tuple[Tuple[str, type, Any], ...]
+) -> str:
+    return url_for(endpoint, **{k: v for k, _, v in values}, _external=True)
+
+
+def external_url_for(endpoint: str, **values: Any) -> str:
+    """Build an external url with ``url_for`` (cached by url root, endpoint and values).
+
+    The url map does not change after the app is set up, so the same
+    arguments always produce the same url for the same app and url root.
+    """
+    if has_request_context():
+        # include the value types as equal values of different types (e.g. 1 and True)
+        # can produce different urls
+        key = tuple((k, type(v), v) for k, v in values.items())
+        try:
+            hash(key)
+        except TypeError:
+            pass  # unhashable values cannot be cached
+        else:
+            cache = _get_app_cache(_EXTERNAL_URL_CACHE, _build_external_url, 4096)
+            return cache(request.url_root, endpoint, key)
+    return url_for(endpoint, **values, _external=True)
+
+
 class KeyGenerator:
     """Base class (and registry) of all api key generators.
 
@@ -317,14 +394,16 @@ class LinkGenerator:
         """
         is_page = isinstance(resource, PageResource)
 
-        # find generator
-        generators, resource_type = LinkGenerator._get_generators_and_resource_type(
-            resource
-        )
-        generator = (
-            generators.get(resource_type)
-            if for_relation is None
-            else generators.get((resource_type, for_relation))
+        # find generator (inlined _get_generators_and_resource_type, this is called
+        # for every link of every response)
+        if is_page or isinstance(resource, CollectionResource):
+            generators = LinkGenerator.__generators_for_page_resources
+            resource_type: Type = resource.resource_type
+        else:
+            generators = LinkGenerator.__generators
+            resource_type = type(resource)
+        generator = generators.get(
+            resource_type if for_relation is None else (resource_type, for_relation)
         )
 
         if generator is not None:
@@ -840,6 +919,7 @@ class DeletedApiObjectApiResponseGenerator(
 
 # late imports to avoid circular references
 from .generators.constants import (  # isort:skip
+    API_SPEC_RESOURCE,
     CREATE_REL,
     DELETE_REL,
     DELETED_REL,
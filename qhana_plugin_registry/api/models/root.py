@@ -30,6 +30,6 @@ class RootSchema(bm.ApiObjectSchema):
     title = ma.fields.String(required=True, allow_none=False, dump_only=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class RootData(bm.BaseApiObject):
     title: str
@@ -17,7 +17,7 @@ from typing import Sequence, Optional
 from ...db.models.templates import UiTemplate, TemplateTab
 
 
-@dataclass
+@dataclass(slots=True)
 class TemplateGroupRaw:
     template: UiTemplate
     location: str
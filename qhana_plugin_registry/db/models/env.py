@@ -15,7 +15,7 @@
 from dataclasses import dataclass, field
 from typing import Optional, Sequence
 
-from sqlalchemy.sql import delete, select
+from sqlalchemy.sql import delete, select, update
 from sqlalchemy.sql import sqltypes as sql
 from sqlalchemy.sql.functions import count
 from sqlalchemy.sql.schema import Column
@@ -40,12 +40,12 @@ class Env(ExistsMixin):
     @classmethod
     def get_names(cls) -> Sequence[str]:
         """Get a list of known env var names."""
-        return DB.session.execute(select(cls.name)).scalars()
+        return DB.session.execute(select(cls.name)).scalars().all()
 
     @classmethod
     def get_items(cls) -> Sequence["Env"]:
-        """Get a list of known env vars."""
-        return DB.session.execute(select(cls)).scalars()
+        """Get a list of known env vars (fetched with a single query)."""
+        return DB.session.execute(select(cls)).scalars().all()
 
     @classmethod
     def get_count(cls) -> int:
@@ -55,8 +55,8 @@ class Env(ExistsMixin):
     @classmethod
     def get(cls, name: str, default=None) -> Optional["Env"]:
         """Get an env var. (Returns `default` if env var is unset.)"""
-        q = select(cls).filter(cls.name == name).limit(1)
-        result = DB.session.execute(q).scalar_one_or_none()
+        # primary key lookup, checks the identity map before querying the db
+        result = DB.session.get(cls, name)
         if result is None:
             return default
         return result
@@ -74,8 +74,7 @@ class Env(ExistsMixin):
     def set(cls, name: str, value: str) -> "Env":
         """Set an env var value. (Does not commit the session!)"""
         assert value is not None, "Use remove to unset values!"
-        q = select(cls).filter(cls.name == name).limit(1)
-        env_var: Optional[Env] = DB.session.execute(q).scalar_one_or_none()
+        env_var: Optional[Env] = DB.session.get(cls, name)
         if env_var is None:
             env_var = Env(name, value)
         else:
@@ -83,6 +82,21 @@ class Env(ExistsMixin):
         DB.session.add(env_var)
         return env_var
 
+    @classmethod
+    def update_value(cls, name: str, value: str) -> Optional["Env"]:
+        """Update the value of an existing env var. (Does not commit the session!)
+
+        Returns the updated env var or None if the env var is unset.
+        """
+        if DB.engine.dialect.update_returning:
+            # update and fetch the env var in one round trip
+            q = update(cls).where(cls.name == name).values(value=value).returning(cls)
+            return DB.session.execute(q).scalar_one_or_none()
+        env_var: Optional[Env] = DB.session.get(cls, name)
+        if env_var is not None:
+            env_var.value = value
+        return env_var
+
     @classmethod
     def remove(cls, name: str):
         """Remove an env var value. (Does not commit the session!)"""
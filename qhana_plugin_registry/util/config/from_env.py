@@ -1,7 +1,9 @@
 import re
+from copy import deepcopy
+from functools import lru_cache
 from json import loads
 from os import environ
-from typing import Mapping
+from typing import Any, Dict, FrozenSet, Mapping, Tuple
 
 from flask import Config
 
@@ -12,63 +14,112 @@ spaces or any of the other separator characters. The value may not start with
 a space and cannot contain newline characters."""
 
 
-def load_config_from_env(config: Config):
-    _load_database_uri_from_env(config)
-    _load_celery_config_from_env(config)
-    _load_plugin_discovery_config_from_env(config)
-    _load_plugin_recommendation_config_from_env(config)
-    _load_preconfigured_values(config)
-    _load_url_rewrite_rules(config, "URL_MAP_FROM_LOCALHOST")
-    _load_url_rewrite_rules(config, "URL_MAP_TO_LOCALHOST")
-
-
-def _load_database_uri_from_env(config: Config):
-    if "SQLALCHEMY_DATABASE_URI" in environ:
-        config["SQLALCHEMY_DATABASE_URI"] = environ["SQLALCHEMY_DATABASE_URI"]
+_CONFIG_ENV_VARS = frozenset(
+    (
+        "SQLALCHEMY_DATABASE_URI",
+        "BROKER_URL",
+        "RESULT_BACKEND",
+        "CELERY_QUEUE",
+        "PLUGIN_DISCOVERY_INTERVAL",
+        "PLUGIN_BATCH_SIZE",
+        "PLUGIN_PURGE_INTERVAL",
+        "PLUGIN_PURGE_AFTER",
+        "PLUGIN_RECOMMENDER_WEIGHTS",
+        "INITIAL_PLUGIN_SEEDS",
+        "PRECONFIGURED_SERVICES",
+        "URL_MAP_FROM_LOCALHOST",
+        "URL_MAP_TO_LOCALHOST",
+    )
+)
+"""All environment variables (except the ones prefixed with QHANA_ENV_) read by this module."""
 
 
-def _load_celery_config_from_env(config: Config):
-    if "BROKER_URL" in environ:
+def load_config_from_env(config: Config):
+    env = frozenset(
+        (k, v)
+        for k, v in environ.items()
+        if k in _CONFIG_ENV_VARS or k.startswith("QHANA_ENV_")
+    )
+    # copy the cached values as the config may be mutated later
+    env_config = deepcopy(_parse_config_from_env(env))
+
+    if "CELERY" in env_config:
+        config.setdefault("CELERY", {}).update(env_config.pop("CELERY"))
+    config.setdefault("CURRENT_ENV", {}).update(env_config.pop("CURRENT_ENV"))
+    config.update(env_config)
+
+    _compile_url_rewrite_rules(config, "URL_MAP_FROM_LOCALHOST")
+    _compile_url_rewrite_rules(config, "URL_MAP_TO_LOCALHOST")
+
+
+@lru_cache(maxsize=8)
+def _parse_config_from_env(env: FrozenSet[Tuple[str, str]]) -> Dict[str, Any]:
+    """Parse the config values set in the given environment variables.
+
+    The result only depends on the (relevant) environment variables and is
+    cached to avoid parsing the same environment for every new app instance.
+    """
+    env_vars = dict(env)
+    config: Dict[str, Any] = {}
+    _load_database_uri_from_env(config, env_vars)
+    _load_celery_config_from_env(config, env_vars)
+    _load_plugin_discovery_config_from_env(config, env_vars)
+    _load_plugin_recommendation_config_from_env(config, env_vars)
+    _load_preconfigured_values(config, env_vars)
+    _load_url_rewrite_rules(config, env_vars, "URL_MAP_FROM_LOCALHOST")
+    _load_url_rewrite_rules(config, env_vars, "URL_MAP_TO_LOCALHOST")
+    return config
+
+
+def _load_database_uri_from_env(config: Dict[str, Any], env: Mapping[str, str]):
+    if "SQLALCHEMY_DATABASE_URI" in env:
+        config["SQLALCHEMY_DATABASE_URI"] = env["SQLALCHEMY_DATABASE_URI"]
+
+
+def _load_celery_config_from_env(config: Dict[str, Any], env: Mapping[str, str]):
+    if "BROKER_URL" in env:
         celery_conf = config.get("CELERY", {})
-        celery_conf["broker_url"] = environ["BROKER_URL"]
+        celery_conf["broker_url"] = env["BROKER_URL"]
         config["CELERY"] = celery_conf
 
-    if "RESULT_BACKEND" in environ:
+    if "RESULT_BACKEND" in env:
         celery_conf = config.get("CELERY", {})
-        celery_conf["result_backend"] = environ["RESULT_BACKEND"]
+        celery_conf["result_backend"] = env["RESULT_BACKEND"]
         config["CELERY"] = celery_conf
 
-    if "CELERY_QUEUE" in environ:
+    if "CELERY_QUEUE" in env:
         celery_conf = config.get("CELERY", {})
-        celery_conf["task_default_queue"] = environ["CELERY_QUEUE"]
+        celery_conf["task_default_queue"] = env["CELERY_QUEUE"]
         config["CELERY"] = celery_conf
 
 
-def _load_plugin_discovery_config_from_env(config: Config):
-    if "PLUGIN_DISCOVERY_INTERVAL" in environ:
-        interval = int(environ["PLUGIN_DISCOVERY_INTERVAL"])
+def _load_plugin_discovery_config_from_env(
+    config: Dict[str, Any], env: Mapping[str, str]
+):
+    if "PLUGIN_DISCOVERY_INTERVAL" in env:
+        interval = int(env["PLUGIN_DISCOVERY_INTERVAL"])
         if interval < 1 and interval != -1:
             raise ValueError(
                 f"PLUGIN_DISCOVERY_INTERVAL may not be smaller than 1 (got {interval})! Use -1 to disable plugin discovery job."
             )
         config["PLUGIN_DISCOVERY_INTERVAL"] = interval
 
-    if "PLUGIN_BATCH_SIZE" in environ:
-        size = int(environ["PLUGIN_BATCH_SIZE"])
+    if "PLUGIN_BATCH_SIZE" in env:
+        size = int(env["PLUGIN_BATCH_SIZE"])
         if size < 1:
             raise ValueError(f"PLUGIN_BATCH_SIZE may not be smaller than 1 (got {size})!")
         config["PLUGIN_BATCH_SIZE"] = size
 
-    if "PLUGIN_PURGE_INTERVAL" in environ:
-        interval = int(environ["PLUGIN_PURGE_INTERVAL"])
+    if "PLUGIN_PURGE_INTERVAL" in env:
+        interval = int(env["PLUGIN_PURGE_INTERVAL"])
         if interval < 1 and interval != -1:
             raise ValueError(
                 f"PLUGIN_PURGE_INTERVAL may not be smaller than 1 (got {interval})! Use -1 to disable plugin purging job."
             )
         config["PLUGIN_PURGE_INTERVAL"] = interval
 
-    if "PLUGIN_PURGE_AFTER" in environ:
-        purge_after = environ["PLUGIN_PURGE_AFTER"]
+    if "PLUGIN_PURGE_AFTER" in env:
+        purge_after = env["PLUGIN_PURGE_AFTER"]
         if purge_after in ("auto", "never"):
             config["PLUGIN_PURGE_AFTER"] = purge_after
         else:
@@ -80,9 +131,11 @@ def _load_plugin_discovery_config_from_env(config: Config):
             config["PLUGIN_PURGE_AFTER"] = interval
 
 
-def _load_plugin_recommendation_config_from_env(config: Config):
-    if "PLUGIN_RECOMMENDER_WEIGHTS" in environ:
-        weights_str = environ["PLUGIN_RECOMMENDER_WEIGHTS"]
+def _load_plugin_recommendation_config_from_env(
+    config: Dict[str, Any], env: Mapping[str, str]
+):
+    if "PLUGIN_RECOMMENDER_WEIGHTS" in env:
+        weights_str = env["PLUGIN_RECOMMENDER_WEIGHTS"]
         if weights_str.startswith("{"):
             config["PLUGIN_RECOMMENDER_WEIGHTS"] = loads(weights_str)
         else:
@@ -95,28 +148,30 @@ def _load_plugin_recommendation_config_from_env(config: Config):
             }
 
 
-def _load_preconfigured_values(config: Config):
+def _load_preconfigured_values(config: Dict[str, Any], env: Mapping[str, str]):
     env_dict = config.get("CURRENT_ENV", {})
     # load all env variables prefixed with QHANA_ENV_ (remove prefix)
-    env_dict.update({k[10:]: v for k, v in environ.items() if k.startswith("QHANA_ENV_")})
+    env_dict.update({k[10:]: v for k, v in env.items() if k.startswith("QHANA_ENV_")})
     config["CURRENT_ENV"] = env_dict
-    if "INITIAL_PLUGIN_SEEDS" in environ:
-        seeds = environ["INITIAL_PLUGIN_SEEDS"]
+    if "INITIAL_PLUGIN_SEEDS" in env:
+        seeds = env["INITIAL_PLUGIN_SEEDS"]
         if seeds.startswith("["):
             config["INITIAL_PLUGIN_SEEDS"] = loads(seeds)
         else:
             config["INITIAL_PLUGIN_SEEDS"] = [
                 s.strip() for s in seeds.splitlines() if s and not s.isspace()
             ]
-    if "PRECONFIGURED_SERVICES" in environ:
-        services = environ["PRECONFIGURED_SERVICES"]
+    if "PRECONFIGURED_SERVICES" in env:
+        services = env["PRECONFIGURED_SERVICES"]
         config["PRECONFIGURED_SERVICES"] = loads(services)
 
 
-def _load_url_rewrite_rules(config: Config, key: str):
-    if key in environ:
-        config[key] = loads(environ[key])
+def _load_url_rewrite_rules(config: Dict[str, Any], env: Mapping[str, str], key: str):
+    if key in env:
+        config[key] = loads(env[key])
+
 
+def _compile_url_rewrite_rules(config: Config, key: str):
     if isinstance(config.get(key), Mapping):
         # rewrite mapping to tuple sequence and precompile regex patterns
         url_map = config[key]
@@ -0,0 +1,145 @@
+# Copyright 2022 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module containing a faster json provider based on orjson (if installed)."""
+
+from dataclasses import fields, is_dataclass
+from math import isfinite
+from re import compile as compile_regex
+from typing import Any, Optional
+
+from flask import Flask, Response
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional dependency
+    orjson = None
+
+
+_SUPPORTED_DUMPS_ARGS = frozenset(
+    ("default", "ensure_ascii", "sort_keys", "indent", "separators")
+)
+
+_COMPACT_SEPARATORS = (",", ":")
+_INDENT_SEPARATORS = (",", ": ")  # the json.dumps default separators if indent is set
+
+# output orjson may have produced from a float the json module serializes differently
+# (NaN and Infinity as null, exponents without "+" or leading zeros, small floats
+# without exponent), false positives only cost an additional check of the object
+_FLOAT_MISMATCH_CANDIDATE = compile_regex(rb"null|[0-9][eE]|0\.0000")
+
+
+def _has_mismatching_float(obj: Any) -> bool:
+    """Check for floats orjson serializes differently than the json module.
+
+    The json module writes NaN and Infinity (orjson writes null) and uses
+    ``float.__repr__``, which switches to exponent notation outside of
+    ``1e-4 <= abs(value) < 1e16`` with a "+" for positive exponents and at
+    least two exponent digits (e.g., "1e+16" and "1e-05" instead of "1e16"
+    and "0.00001").
+    """
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not isfinite(value) or abs(value) >= 1e16 or 1e-9 <= abs(value) < 1e-4:
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif is_dataclass(value) and not isinstance(value, type):
+            stack.extend(getattr(value, f.name) for f in fields(value))
+    return False
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider using orjson to serialize json.
+
+    Supports the same settings as the default provider. Values orjson cannot
+    serialize (and dates, to keep the http date format) are passed to the
+    ``default`` function of the default provider. Everything orjson would
+    serialize differently (e.g., integers exceeding 64 bit, non string keys,
+    escaped non ascii characters, NaN, Infinity and floats in exponent notation,
+    other indentations) is serialized by the default provider.
+    """
+
+    def _dumps_bytes(
+        self,
+        obj: Any,
+        *,
+        indent: bool = False,
+        append_newline: bool = False,
+        **kwargs: Any,
+    ) -> bytes:
+        option = orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if append_newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(
+            obj, default=kwargs.get("default", self.default), option=option
+        )
+
+    def _try_dumps_bytes(self, obj: Any, **kwargs: Any) -> Optional[bytes]:
+        """Serialize with orjson, returns None if the default provider must be used."""
+        try:
+            data = self._dumps_bytes(obj, **kwargs)
+        except orjson.JSONEncodeError:
+            return None
+        if kwargs.get("ensure_ascii", self.ensure_ascii) and not data.isascii():
+            return None
+        if _FLOAT_MISMATCH_CANDIDATE.search(data) and _has_mismatching_float(obj):
+            return None
+        return data
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if not _SUPPORTED_DUMPS_ARGS.issuperset(kwargs):
+            return super().dumps(obj, **kwargs)
+        indent = kwargs.get("indent")
+        separators = kwargs.get("separators")
+        if separators is not None:
+            separators = tuple(separators)
+        if indent is None:
+            use_orjson = separators == _COMPACT_SEPARATORS
+        else:
+            use_orjson = indent == 2 and separators in (None, _INDENT_SEPARATORS)
+        if use_orjson:
+            data = self._try_dumps_bytes(
+                obj,
+                indent=indent is not None,
+                **{k: v for k, v in kwargs.items() if k not in ("indent", "separators")},
+            )
+            if data is not None:
+                return data.decode()
+        return super().dumps(obj, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        # same as the default provider, but passes the serialized bytes directly
+        # to the response (skips decoding and reencoding the json string)
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        data = self._try_dumps_bytes(obj, indent=indent, append_newline=True)
+        if data is None:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(data, mimetype=self.mimetype)
+
+
+def register_json_provider(app: Flask):
+    """Replace the default json provider of the app with the orjson provider if orjson is installed."""
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
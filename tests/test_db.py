@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pytest
+
 from conftests import tmp_app, tmp_db
+from qhana_plugin_registry.db.models.env import Env
 from qhana_plugin_registry.db.models.plugins import RAMP, PluginTag, TagToRAMP
 
 
@@ -37,3 +40,38 @@ def test_ramp_manual_init_tags(tmp_db, *args):
         tmp_db.session.add(TagToRAMP(ramp, tag))
     tmp_db.session.add(ramp)
     tmp_db.session.commit()
+
+
+@pytest.fixture(params=[True, False], ids=["returning", "no-returning"])
+def update_returning(request, tmp_db, monkeypatch):
+    """Run the test with and without UPDATE ... RETURNING support of the dialect."""
+    if not request.param:
+        monkeypatch.setattr(tmp_db.engine.dialect, "update_returning", False)
+    return request.param
+
+
+def test_env_update_value(tmp_db, update_returning):
+    tmp_db.session.add(Env("hello", "world"))
+    tmp_db.session.commit()
+    env_var = Env.update_value("hello", "there")
+    assert env_var is not None
+    assert env_var.name == "hello"
+    assert env_var.value == "there"
+    tmp_db.session.commit()
+    assert Env.get_value("hello") == "there"
+
+
+def test_env_update_value_missing(tmp_db, update_returning):
+    assert Env.update_value("missing", "value") is None
+    tmp_db.session.commit()
+    assert Env.get("missing") is None
+
+
+def test_env_update_value_identity_map(tmp_db, update_returning):
+    tmp_db.session.add(Env("hello", "world"))
+    tmp_db.session.commit()
+    env_var = Env.get("hello")  # loads the instance into the identity map
+    assert env_var.value == "world"
+    updated = Env.update_value("hello", "there")
+    assert updated is env_var
+    assert env_var.value == "there"
@@ -0,0 +1,108 @@
+# Copyright 2022 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from conftests import client, tmp_app, tmp_db
+
+orjson = pytest.importorskip("orjson")
+
+from qhana_plugin_registry.util.json_provider import OrjsonProvider  # noqa: E402
+
+TEST_OBJECTS = [
+    {"b": 1, "a": [1, 2.5, None, True], "c": {"z": "z", "y": "y"}},
+    {"text": 'äö€   "quoted"', "emoji": "\U0001f600"},
+    {"date": date(2022, 2, 2), "datetime": datetime(2022, 2, 2, 12, tzinfo=timezone.utc)},
+    {"decimal": Decimal("1.50"), "uuid": UUID(int=42)},
+    {"nan": float("nan"), "inf": float("inf"), "-inf": float("-inf")},
+    [1e16, 1e22, -1.5e300, 9999999999999998.0, 1e15, 123456.789],
+    [1e-4, 1e-5, 8.2e-5, 1e-7, 1e-9, 1e-10, 5e-324, 0.0, -0.0],
+    {"big": 2**70, "small": -(2**70)},
+    [2**64, 2**63 - 1, -(2**63)],
+    {1: "non string key"},
+    [],
+    {},
+]
+
+DUMPS_KWARGS = [
+    {},
+    {"separators": (",", ":")},
+    {"indent": 2},
+    {"indent": 4},
+    {"indent": "\t"},
+    {"indent": 2, "separators": (",", ":")},
+    {"ensure_ascii": False, "separators": (",", ":")},
+    {"sort_keys": False, "separators": (",", ":")},
+]
+
+
+@pytest.fixture()
+def providers():
+    app = Flask(__name__)  # providers only keep a weak reference to the app
+    yield OrjsonProvider(app), DefaultJSONProvider(app)
+
+
+@pytest.mark.parametrize("sort_keys", [True, False])
+@pytest.mark.parametrize("kwargs", DUMPS_KWARGS)
+@pytest.mark.parametrize("obj", TEST_OBJECTS)
+def test_dumps_parity(providers, obj, kwargs, sort_keys):
+    orjson_provider, default_provider = providers
+    orjson_provider.sort_keys = default_provider.sort_keys = sort_keys
+    assert orjson_provider.dumps(obj, **kwargs) == default_provider.dumps(obj, **kwargs)
+
+
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+@pytest.mark.parametrize("obj", TEST_OBJECTS)
+def test_dumps_ensure_ascii_parity(providers, obj, ensure_ascii):
+    orjson_provider, default_provider = providers
+    orjson_provider.ensure_ascii = default_provider.ensure_ascii = ensure_ascii
+    kwargs = {"separators": (",", ":")}
+    assert orjson_provider.dumps(obj, **kwargs) == default_provider.dumps(obj, **kwargs)
+
+
+@pytest.mark.parametrize("debug", [True, False])
+@pytest.mark.parametrize("compact", [True, False, None])
+@pytest.mark.parametrize("obj", TEST_OBJECTS)
+def test_response_parity(providers, obj, compact, debug):
+    orjson_provider, default_provider = providers
+    orjson_provider.compact = default_provider.compact = compact
+    app = orjson_provider._app
+    app.debug = debug
+    with app.app_context():
+        orjson_response = orjson_provider.response(obj)
+        default_response = default_provider.response(obj)
+    assert orjson_response.mimetype == default_response.mimetype
+    assert orjson_response.get_data() == default_response.get_data()
+
+
+def test_loads_big_int(providers):
+    orjson_provider, _ = providers
+    assert orjson_provider.loads(str(2**70)) == 2**70
+
+
+def test_app_uses_orjson_provider(tmp_app):
+    assert isinstance(tmp_app.json, OrjsonProvider)
+    assert tmp_app.json.sort_keys is True
+    assert tmp_app.json.compact is True
+
+
+def test_invalid_request_body(client, tmp_db):
+    response = client.post("/api/env/", data="{invalid", content_type="application/json")
+    assert response.status_code == 400